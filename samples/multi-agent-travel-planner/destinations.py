@@ -0,0 +1,38 @@
+"""Destination catalogue shared by the travel planner and its Streamlit UI.
+
+Kept free of LangChain/Azure imports so the UI can render before the agent
+stack is loaded.
+"""
+
+DESTINATIONS = {
+    "Santiago": {
+        "country": "Chile",
+        "currency": "CLP",
+        "airport": "SCL",
+        "highlights": [
+            "Valparaiso harbor tour",
+            "Bodega wine tasting",
+            "Boat Trip Vina Del Mar",
+        ],
+    },
+    "tokyo": {
+        "country": "Japan",
+        "currency": "JPY",
+        "airport": "HND",
+        "highlights": [
+            "Sushi masterclass in Tsukiji",
+            "Ghibli Museum visit",
+            "Day trip to Hakone hot springs",
+        ],
+    },
+    "rome": {
+        "country": "Italy",
+        "currency": "EUR",
+        "airport": "FCO",
+        "highlights": [
+            "Colosseum underground tour",
+            "Private pasta masterclass",
+            "Sunset walk through Trastevere",
+        ],
+    },
+}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import random
@@ -13,6 +14,8 @@ from uuid import uuid4
 from azure.monitor.opentelemetry import configure_azure_monitor
 from dotenv import load_dotenv
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import merge_configs
 from langchain_core.tools import StructuredTool, tool
 from langchain_openai import AzureChatOpenAI
 from langgraph.graph import END, START, StateGraph
@@ -35,41 +38,9 @@ from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
-load_dotenv()
-
+from destinations import DESTINATIONS
 
-DESTINATIONS = {
-    "Santiago": {
-        "country": "Chile",
-        "currency": "CLP",
-        "airport": "SCL",
-        "highlights": [
-            "Valparaiso harbor tour",
-            "Bodega wine tasting",
-            "Boat Trip Vina Del Mar",
-        ],
-    },
-    "tokyo": {
-        "country": "Japan",
-        "currency": "JPY",
-        "airport": "HND",
-        "highlights": [
-            "Sushi masterclass in Tsukiji",
-            "Ghibli Museum visit",
-            "Day trip to Hakone hot springs",
-        ],
-    },
-    "rome": {
-        "country": "Italy",
-        "currency": "EUR",
-        "airport": "FCO",
-        "highlights": [
-            "Colosseum underground tour",
-            "Private pasta masterclass",
-            "Sunset walk through Trastevere",
-        ],
-    },
-}
+load_dotenv()
 
 
 class PlannerState(TypedDict):
@@ -92,6 +63,13 @@ class PlannerState(TypedDict):
 
 TRACER: Optional[AzureAIOpenTelemetryTracer] = None
 
+# State keys holding each specialist's result from the run_all_parallel node
+SPECIALIST_SUMMARY_KEYS = {
+    "flight_specialist": "flight_summary",
+    "hotel_specialist": "hotel_summary",
+    "activity_specialist": "activities_summary",
+}
+
 
 def _pick_destination(user_request: str) -> str:
     lowered = user_request.lower()
@@ -110,9 +88,9 @@ def _pick_origin(user_request: str) -> str:
 
 
 def _compute_dates() -> tuple[str, str]:
-    start = datetime.now() + timedelta(days=21)
+    start = datetime.now().date() + timedelta(days=21)
     end = start + timedelta(days=5)
-    return start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+    return start.isoformat(), end.isoformat()
 
 
 def _model_name() -> str:
@@ -240,83 +218,7 @@ def coordinator_node(state: PlannerState) -> PlannerState:
     )
     response = llm.invoke([system_message] + state["messages"])
     state["messages"].append(response)
-    state["current_agent"] = "flight_specialist"
-    return state
-
-
-def flight_specialist_node(state: PlannerState) -> PlannerState:
-    llm = _create_llm(
-        "flight_specialist", temperature=0.4, session_id=state["session_id"]
-    )
-    agent = _create_react_agent(llm, tools=[mock_search_flights])
-    task = (
-        f"Find an appealing flight from {state['origin']} to {state['destination']} "
-        f"departing {state['departure']} for {state['travellers']} travellers."
-    )
-    metadata = _agent_metadata(
-        "flight_specialist",
-        session_id=state["session_id"],
-        temperature=0.4,
-        agent_description="Flight specialist agent",
-        span_sources=("AgentExecutor",),
-    )
-    invoke_config = {"metadata": metadata}
-    if TRACER:
-        invoke_config["callbacks"] = [TRACER]
-    result = agent.invoke(
-        {"messages": [HumanMessage(content=task)]},
-        config=invoke_config,
-    )
-    final_message = result["messages"][-1]
-    state["flight_summary"] = (
-        final_message.content
-        if isinstance(final_message, BaseMessage)
-        else str(final_message)
-    )
-    state["messages"].append(
-        final_message
-        if isinstance(final_message, BaseMessage)
-        else AIMessage(content=str(final_message))
-    )
-    state["current_agent"] = "hotel_specialist"
-    return state
-
-
-def hotel_specialist_node(state: PlannerState) -> PlannerState:
-    llm = _create_llm(
-        "hotel_specialist", temperature=0.5, session_id=state["session_id"]
-    )
-    agent = _create_react_agent(llm, tools=[mock_search_hotels])
-    task = (
-        f"Recommend a boutique hotel in {state['destination']} between {state['departure']} "
-        f"and {state['return_date']} for {state['travellers']} travellers."
-    )
-    metadata = _agent_metadata(
-        "hotel_specialist",
-        session_id=state["session_id"],
-        temperature=0.5,
-        agent_description="Hotel specialist agent",
-        span_sources=("AgentExecutor",),
-    )
-    invoke_config = {"metadata": metadata}
-    if TRACER:
-        invoke_config["callbacks"] = [TRACER]
-    result = agent.invoke(
-        {"messages": [HumanMessage(content=task)]},
-        config=invoke_config,
-    )
-    final_message = result["messages"][-1]
-    state["hotel_summary"] = (
-        final_message.content
-        if isinstance(final_message, BaseMessage)
-        else str(final_message)
-    )
-    state["messages"].append(
-        final_message
-        if isinstance(final_message, BaseMessage)
-        else AIMessage(content=str(final_message))
-    )
-    state["current_agent"] = "activity_specialist"
+    state["current_agent"] = "run_all_parallel"
     return state
 
 
@@ -346,37 +248,110 @@ def _invoke_inner_summary_agent(
     return message.content if isinstance(message, BaseMessage) else str(message)
 
 
-def activity_specialist_node(state: PlannerState) -> PlannerState:
-    llm = _create_llm(
-        "activity_specialist", temperature=0.6, session_id=state["session_id"]
-    )
-    agent = _create_react_agent(llm, tools=[mock_search_activities])
-    task = f"Curate signature activities for travellers spending a week in {state['destination']}."
+async def _run_specialist(
+    agent_name: str,
+    state: PlannerState,
+    config: RunnableConfig,
+    *,
+    temperature: float,
+    tools: Sequence[Any],
+    task: str,
+    agent_description: str,
+) -> BaseMessage:
+    """Run a specialist ReAct agent asynchronously and return its final message.
+
+    The parent node's ``config`` is merged into the agent's own config so its
+    callbacks stay attached to the graph run on Python versions where async
+    context does not propagate to child runnables.
+    """
+    llm = _create_llm(agent_name, temperature=temperature, session_id=state["session_id"])
+    agent = _create_react_agent(llm, tools=list(tools))
     metadata = _agent_metadata(
-        "activity_specialist",
+        agent_name,
         session_id=state["session_id"],
-        temperature=0.6,
-        agent_description="Activity specialist agent",
+        temperature=temperature,
+        agent_description=agent_description,
         span_sources=("AgentExecutor",),
     )
     invoke_config = {"metadata": metadata}
     if TRACER:
         invoke_config["callbacks"] = [TRACER]
-    result = agent.invoke(
+    result = await agent.ainvoke(
         {"messages": [HumanMessage(content=task)]},
-        config=invoke_config,
+        config=merge_configs(config, invoke_config),
     )
     final_message = result["messages"][-1]
-    state["activities_summary"] = (
-        final_message.content
-        if isinstance(final_message, BaseMessage)
-        else str(final_message)
-    )
-    state["messages"].append(
+    return (
         final_message
         if isinstance(final_message, BaseMessage)
         else AIMessage(content=str(final_message))
     )
+
+
+async def flight_specialist_async(
+    state: PlannerState, config: RunnableConfig
+) -> BaseMessage:
+    task = (
+        f"Find an appealing flight from {state['origin']} to {state['destination']} "
+        f"departing {state['departure']} for {state['travellers']} travellers."
+    )
+    return await _run_specialist(
+        "flight_specialist",
+        state,
+        config,
+        temperature=0.4,
+        tools=[mock_search_flights],
+        task=task,
+        agent_description="Flight specialist agent",
+    )
+
+
+async def hotel_specialist_async(
+    state: PlannerState, config: RunnableConfig
+) -> BaseMessage:
+    task = (
+        f"Recommend a boutique hotel in {state['destination']} between {state['departure']} "
+        f"and {state['return_date']} for {state['travellers']} travellers."
+    )
+    return await _run_specialist(
+        "hotel_specialist",
+        state,
+        config,
+        temperature=0.5,
+        tools=[mock_search_hotels],
+        task=task,
+        agent_description="Hotel specialist agent",
+    )
+
+
+async def activity_specialist_async(
+    state: PlannerState, config: RunnableConfig
+) -> BaseMessage:
+    task = f"Curate signature activities for travellers spending a week in {state['destination']}."
+    return await _run_specialist(
+        "activity_specialist",
+        state,
+        config,
+        temperature=0.6,
+        tools=[mock_search_activities],
+        task=task,
+        agent_description="Activity specialist agent",
+    )
+
+
+async def run_all_parallel_node(
+    state: PlannerState, config: RunnableConfig
+) -> PlannerState:
+    """Run the flight, hotel and activity specialists concurrently."""
+    flight, hotel, activities = await asyncio.gather(
+        flight_specialist_async(state, config),
+        hotel_specialist_async(state, config),
+        activity_specialist_async(state, config),
+    )
+    state["flight_summary"] = flight.content
+    state["hotel_summary"] = hotel.content
+    state["activities_summary"] = activities.content
+    state["messages"].extend([flight, hotel, activities])
     state["current_agent"] = "plan_synthesizer"
     return state
 
@@ -457,9 +432,7 @@ def plan_synthesizer_node(state: PlannerState) -> PlannerState:
 def should_continue(state: PlannerState) -> str:
     mapping = {
         "start": "coordinator",
-        "flight_specialist": "flight_specialist",
-        "hotel_specialist": "hotel_specialist",
-        "activity_specialist": "activity_specialist",
+        "run_all_parallel": "run_all_parallel",
         "plan_synthesizer": "plan_synthesizer",
     }
     return mapping.get(state["current_agent"], END)
@@ -468,19 +441,43 @@ def should_continue(state: PlannerState) -> str:
 def build_workflow() -> StateGraph:
     graph = StateGraph(PlannerState)
     graph.add_node("coordinator", coordinator_node)
-    graph.add_node("flight_specialist", flight_specialist_node)
-    graph.add_node("hotel_specialist", hotel_specialist_node)
-    graph.add_node("activity_specialist", activity_specialist_node)
+    graph.add_node("run_all_parallel", run_all_parallel_node)
     graph.add_node("plan_synthesizer", plan_synthesizer_node)
     graph.add_conditional_edges(START, should_continue)
     graph.add_conditional_edges("coordinator", should_continue)
-    graph.add_conditional_edges("flight_specialist", should_continue)
-    graph.add_conditional_edges("hotel_specialist", should_continue)
-    graph.add_conditional_edges("activity_specialist", should_continue)
+    graph.add_conditional_edges("run_all_parallel", should_continue)
     graph.add_conditional_edges("plan_synthesizer", should_continue)
     return graph
 
 
+async def _stream_plan(
+    app: Any, initial_state: PlannerState, config: dict[str, Any]
+) -> Optional[PlannerState]:
+    final_state: Optional[PlannerState] = None
+
+    async for step in app.astream(initial_state, config=config):
+        ((node_name, node_state),) = step.items()
+        final_state = node_state
+        if node_name == "run_all_parallel":
+            # The specialists run together; report each one's result
+            previews = [
+                (agent_name, node_state.get(key))
+                for agent_name, key in SPECIALIST_SUMMARY_KEYS.items()
+            ]
+        elif node_state.get("messages"):
+            previews = [(node_name, node_state["messages"][-1].content)]
+        else:
+            previews = [(node_name, None)]
+        for agent_name, preview in previews:
+            print(f"\n🤖 {agent_name.replace('_', ' ').title()} Agent")
+            if preview:
+                if len(preview) > 400:
+                    preview = preview[:400] + "... [truncated]"
+                print(preview)
+
+    return final_state
+
+
 def main() -> None:
     global TRACER  # noqa: PLW0602 - sample wiring
 
@@ -499,7 +496,7 @@ def main() -> None:
         provider_name=os.getenv("NESTED_SAMPLE_PROVIDER", "openai"),
     )
 
-    session_id = str(uuid4())
+    session_id = uuid4().hex
     user_request = (
         "We're planning a long-weekend trip to Santiago from Miami next month. "
         "We'd love a boutique hotel, business-class flights and memorable activities."
@@ -540,19 +537,7 @@ def main() -> None:
     print("🧭 Nested Agent Travel Planner")
     print("=" * 60)
 
-    final_state: Optional[PlannerState] = None
-
-    for step in app.stream(initial_state, config=config):
-        node_name, node_state = next(iter(step.items()))
-        final_state = node_state
-        print(f"\n🤖 {node_name.replace('_', ' ').title()} Agent")
-        if node_state.get("messages"):
-            last = node_state["messages"][-1]
-            if isinstance(last, BaseMessage):
-                preview = last.content
-                if len(preview) > 400:
-                    preview = preview[:400] + "... [truncated]"
-                print(preview)
+    final_state = asyncio.run(_stream_plan(app, initial_state, config))
 
     final_plan = (final_state or {}).get("final_itinerary") or ""
     if final_plan:
@@ -1,47 +1,293 @@
 """Streamlit UI for the Nested Agent Travel Planner."""
 
+import asyncio
+import collections
+import logging
+import threading
+import time
 import streamlit as st
+from cachetools import TTLCache
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 import json
 from uuid import uuid4
 
-# Import the travel planner components
-from nested_agent_travel_planner import (
-    build_workflow,
-    PlannerState,
-    DESTINATIONS,
-    _configure_otlp_tracing,
-    AzureAIOpenTelemetryTracer,
-    TRACER
-)
-from langchain_core.messages import HumanMessage, BaseMessage
-from azure.monitor.opentelemetry import configure_azure_monitor
+# Agent, LangChain and Azure imports are deferred to the functions that need
+# them so the welcome screen renders before the heavy stack is loaded.
+from destinations import DESTINATIONS
 import os
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    from nested_agent_travel_planner import PlannerState
+
 load_dotenv()
 
+# Display names for the destination catalogue, title-cased once at import
+_DEST_TITLES = {dest: dest.title() for dest in DESTINATIONS}
+
+logger = logging.getLogger(__name__)
+
 # Configure monitoring (optional)
-def setup_monitoring():
-    """Setup Azure monitoring if configured."""
-    try:
-        configure_azure_monitor(
-            connection_string=os.getenv("APPLICATION_INSIGHTS_CONNECTION_STRING")
-        )
-        _configure_otlp_tracing()
-    except Exception as e:
-        st.warning(f"Monitoring setup failed: {e}")
+@st.cache_resource(show_spinner=False)
+def start_monitoring() -> threading.Event:
+    """Setup Azure monitoring on a background thread (runs once per process).
+
+    Returns an event that is set once the exporters are configured; nothing on
+    the click path waits on the handshake.
+    """
+    ready = threading.Event()
+
+    def _run():
+        try:
+            from azure.monitor.opentelemetry import configure_azure_monitor
+            from nested_agent_travel_planner import _configure_otlp_tracing
+
+            configure_azure_monitor(
+                connection_string=os.getenv("APPLICATION_INSIGHTS_CONNECTION_STRING")
+            )
+            _configure_otlp_tracing()
+            ready.set()
+        except Exception as e:
+            logger.warning("Monitoring setup failed: %s", e)
+
+    threading.Thread(target=_run, name="monitoring-setup", daemon=True).start()
+    return ready
+
+start_monitoring()
+
+# Finished plans are reused for identical trip inputs within this window
+PLAN_CACHE_TTL = 3600
+PLAN_CACHE_MAX_ENTRIES = 64
+PLAN_RESULT_KEYS = ("flight_summary", "hotel_summary", "activities_summary", "final_itinerary")
+
+class PlanCache:
+    """Thread-safe TTL store of finished plans shared by all sessions."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._plans = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[dict]:
+        with self._lock:
+            return self._plans.get(key)
+
+    def put(self, key, plan: dict) -> None:
+        with self._lock:
+            self._plans[key] = plan
+
+@st.cache_resource(show_spinner=False)
+def get_plan_cache() -> PlanCache:
+    """Create the process-wide plan cache once."""
+    return PlanCache(maxsize=PLAN_CACHE_MAX_ENTRIES, ttl=PLAN_CACHE_TTL)
 
+@st.cache_resource
+def get_compiled_app():
+    """Compile the travel planner graph once and share it across reruns."""
+    from nested_agent_travel_planner import build_workflow
+
+    return build_workflow().compile()
+
+@st.cache_data
 def get_city_suggestions():
     """Get lists of suggested cities for dropdowns."""
     origins = ["Seattle", "New York", "San Francisco", "London", "Los Angeles", "Chicago", "Boston"]
-    destinations = list(DESTINATIONS.keys()) + ["Barcelona", "Amsterdam", "Vienna", "Prague"]
-    return origins, [dest.title() for dest in destinations]
+    destinations = [_DEST_TITLES[dest] for dest in DESTINATIONS] + ["Barcelona", "Amsterdam", "Vienna", "Prague"]
+    return origins, destinations
+
+@st.cache_data
+def popular_destinations_md() -> list:
+    """Prebuild the markdown for the popular destination highlights."""
+    return [
+        f"**{_DEST_TITLES[dest]}, {info['country']}**\n"
+        + "\n".join(f"- {highlight}" for highlight in info["highlights"][:3])
+        for dest, info in list(DESTINATIONS.items())[:3]
+    ]
+
+# Minimum seconds between UI flushes while agents are streaming
+STREAM_FLUSH_INTERVAL = 0.08
+
+async def run_workflow(app, initial_state, config):
+    """Stream workflow events (including token deltas) from LangGraph's async API."""
+    async for event in app.astream_events(initial_state, config=config, version="v2"):
+        yield event
+
+def iter_workflow(app, initial_state, config):
+    """Drive run_workflow on a private event loop, yielding each event to the UI."""
+    loop = asyncio.new_event_loop()
+    events = run_workflow(app, initial_state, config)
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(events.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        loop.run_until_complete(events.aclose())
+        loop.close()
+
+def format_stream(agent_streams: dict) -> str:
+    """Render the streamed text of one or more agents as markdown."""
+    if len(agent_streams) == 1:
+        return "".join(next(iter(agent_streams.values())))
+    return "\n\n".join(
+        f"**{format_agent_name(agent)}**\n\n{''.join(parts)}"
+        for agent, parts in agent_streams.items()
+    )
+
+def preview_text(content: str) -> str:
+    """Shorten agent output for the progress view."""
+    return (content[:300] + "…") if content[300:301] else content
+
+@st.cache_data(max_entries=PLAN_CACHE_MAX_ENTRIES, show_spinner=False)
+def make_initial_state(origin, destination, departure_iso, return_iso, travelers, custom_request) -> dict:
+    """Build the planner state for a set of trip inputs.
+
+    The per-run ``messages`` and ``session_id`` are added by the caller so the
+    cached dict stays picklable and reusable across clicks.
+    """
+    user_request = f"We're planning a trip to {destination} from {origin} departing {departure_iso} and returning {return_iso} for {travelers} travelers. {custom_request}"
+    return {
+        "user_request": user_request,
+        "origin": origin,
+        "destination": destination,
+        "departure": departure_iso,
+        "return_date": return_iso,
+        "travellers": travelers,
+        "flight_summary": None,
+        "hotel_summary": None,
+        "activities_summary": None,
+        "final_itinerary": None,
+        "current_agent": "start",
+    }
+
+# Display labels for graph nodes whose ids don't read well as agent names
+AGENT_LABELS = {
+    "run_all_parallel": "Flight, Hotel & Activity Specialists",
+}
 
 def format_agent_name(agent_name: str) -> str:
     """Format agent names for display."""
-    return agent_name.replace('_', ' ').title()
+    return AGENT_LABELS.get(agent_name) or agent_name.replace('_', ' ').title()
+
+def create_agent_placeholders(agent_steps: list) -> dict:
+    """Lay out one labelled row per agent, returning a placeholder for each."""
+    agent_containers = {}
+    for agent in agent_steps:
+        label_col, output_col = st.columns([1, 4])
+        label_col.markdown(f"**{format_agent_name(agent)}**")
+        agent_containers[agent] = output_col.empty()
+    return agent_containers
+
+def run_plan_with_updates(initial_state: dict) -> dict:
+    """Run the planner workflow, streaming agent progress into the page.
+
+    Returns the final planner state.
+    """
+    from nested_agent_travel_planner import SPECIALIST_SUMMARY_KEYS
+
+    session_id = initial_state["session_id"]
+    
+    # Reuse the compiled workflow
+    app = get_compiled_app()
+    
+    config = {
+        "configurable": {"thread_id": session_id},
+        "metadata": {
+            "session_id": session_id,
+            "thread_id": session_id,
+        },
+        "recursion_limit": 10,
+    }
+    
+    # Create containers for real-time updates
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+    
+    # Agent workflow display
+    st.subheader("🤖 AI Agents Working on Your Trip")
+    
+    agent_steps = ["coordinator", "run_all_parallel", "plan_synthesizer"]
+    agent_containers = create_agent_placeholders(agent_steps)
+    
+    step_count = 0
+    total_steps = len(agent_steps)
+    final_state = {}
+    streams = {}
+    
+    # Pending UI updates, written together at most once per flush interval
+    progress = 0.0
+    status = ""
+    dirty_nodes = set()
+    last_flush = 0.0
+    flushed_progress = None
+    flushed_status = None
+    
+    def flush_updates(force=False):
+        nonlocal flushed_progress, flushed_status
+        # Only send progress/status deltas when their values changed
+        if force or progress != flushed_progress:
+            progress_bar.progress(progress)
+            flushed_progress = progress
+        if force or status != flushed_status:
+            status_text.text(status)
+            flushed_status = status
+        for dirty_node in dirty_nodes:
+            agent_containers[dirty_node].markdown(format_stream(streams[dirty_node]))
+        dirty_nodes.clear()
+    
+    for event in iter_workflow(app, initial_state, config):
+        kind = event["event"]
+        metadata = event.get("metadata", {})
+        # Nested agents inherit the namespace of the graph node that launched them
+        node_name = metadata.get("langgraph_checkpoint_ns", "").split(":", 1)[0]
+        if node_name not in agent_containers:
+            continue
+        
+        if kind == "on_chat_model_stream":
+            # Append token deltas per agent so parallel specialists don't interleave
+            agent_name = metadata.get("agent_name", node_name)
+            node_streams = streams.setdefault(node_name, {})
+            node_streams.setdefault(agent_name, []).append(event["data"]["chunk"].content)
+            dirty_nodes.add(node_name)
+        elif event["name"] == node_name and kind == "on_chain_start":
+            status = f"🔄 {format_agent_name(node_name)} is working..."
+        elif event["name"] == node_name and kind == "on_chain_end":
+            node_state = event["data"]["output"]
+            final_state = node_state
+            step_count += 1
+            progress = min(step_count / total_steps, 1.0)
+            dirty_nodes.discard(node_name)
+            
+            if node_name == "run_all_parallel":
+                # One headed section per specialist, not just the last message appended
+                summaries = {
+                    agent_name: [preview_text(node_state[key])]
+                    for agent_name, key in SPECIALIST_SUMMARY_KEYS.items()
+                    if node_state.get(key)
+                }
+                preview = format_stream(summaries) if summaries else None
+            else:
+                # Get the latest message
+                content = node_state["messages"][-1].content if node_state.get("messages") else None
+                preview = preview_text(content) if content is not None else None
+            if preview is not None:
+                # Replace the streamed text with a preview of the agent's work
+                with agent_containers[node_name]:
+                    st.success(f"✅ {preview}")
+        
+        now = time.monotonic()
+        if now - last_flush > STREAM_FLUSH_INTERVAL:
+            flush_updates()
+            last_flush = now
+    
+    flush_updates(force=True)
+    
+    # Complete
+    progress_bar.progress(1.0)
+    status_text.text("✨ Trip planning complete!")
+    
+    return final_state
 
 def main():
     st.set_page_config(
@@ -80,12 +326,16 @@ def main():
         # Date selection
         st.subheader("📅 Travel Dates")
         
-        min_date = datetime.now().date()
-        max_date = (datetime.now() + timedelta(days=365)).date()
+        # Resolve "today" once per session rather than on every rerun
+        if "_today" not in st.session_state:
+            st.session_state._today = datetime.now().date()
+        today = st.session_state._today
+        min_date = today
+        max_date = today + timedelta(days=365)
         
         departure_date = st.date_input(
             "Departure Date",
-            value=datetime.now().date() + timedelta(days=21),
+            value=today + timedelta(days=21),
             min_value=min_date,
             max_value=max_date
         )
@@ -124,8 +374,15 @@ def main():
             st.error("Return date must be after departure date!")
             return
             
-        # Create user request
-        user_request = f"We're planning a trip to {destination} from {origin} departing {departure_date.strftime('%Y-%m-%d')} and returning {return_date.strftime('%Y-%m-%d')} for {travelers} travelers. {custom_request}"
+        # Create the trip inputs for the planner (memoized on the widget values)
+        base_state = make_initial_state(
+            origin,
+            destination,
+            departure_date.isoformat(),
+            return_date.isoformat(),
+            travelers,
+            custom_request,
+        )
         
         # Display trip summary
         col1, col2, col3 = st.columns(3)
@@ -138,96 +395,39 @@ def main():
         
         st.markdown("---")
         
-        # Setup monitoring
-        setup_monitoring()
-        
         # Initialize session state for workflow tracking
         if 'workflow_steps' not in st.session_state:
-            st.session_state.workflow_steps = []
-        
-        # Create initial state
-        session_id = str(uuid4())
-        initial_state: PlannerState = {
-            "messages": [HumanMessage(content=user_request)],
-            "user_request": user_request,
-            "session_id": session_id,
-            "origin": origin,
-            "destination": destination,
-            "departure": departure_date.strftime('%Y-%m-%d'),
-            "return_date": return_date.strftime('%Y-%m-%d'),
-            "travellers": travelers,
-            "flight_summary": None,
-            "hotel_summary": None,
-            "activities_summary": None,
-            "final_itinerary": None,
-            "current_agent": "start",
-        }
-        
-        # Build and run workflow
-        workflow = build_workflow()
-        app = workflow.compile()
-        
-        config = {
-            "configurable": {"thread_id": session_id},
-            "metadata": {
-                "session_id": session_id,
-                "thread_id": session_id,
-            },
-            "recursion_limit": 10,
-        }
-        
-        # Create containers for real-time updates
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        # Agent workflow display
-        st.subheader("🤖 AI Agents Working on Your Trip")
-        
-        agent_containers = {}
-        agent_steps = ["coordinator", "flight_specialist", "hotel_specialist", "activity_specialist", "plan_synthesizer"]
+            st.session_state.workflow_steps = collections.deque(maxlen=64)
         
-        # Create containers for each agent
-        for i, agent in enumerate(agent_steps):
-            with st.container():
-                col1, col2 = st.columns([1, 4])
-                with col1:
-                    st.markdown(f"**{format_agent_name(agent)}**")
-                with col2:
-                    agent_containers[agent] = st.empty()
+        # Reuse a finished plan for identical trip inputs and skip the agents entirely
+        plan_key = (
+            origin,
+            destination,
+            base_state["departure"],
+            base_state["return_date"],
+            travelers,
+            custom_request,
+        )
+        plan_cache = get_plan_cache()
+        final_state = plan_cache.get(plan_key)
         
-        # Run workflow with real-time updates
         try:
-            step_count = 0
-            total_steps = len(agent_steps)
-            
-            for step in app.stream(initial_state, config=config):
-                node_name, node_state = next(iter(step.items()))
-                step_count += 1
+            if final_state is None:
+                from langchain_core.messages import HumanMessage
                 
-                # Update progress
-                progress = min(step_count / total_steps, 1.0)
-                progress_bar.progress(progress)
-                status_text.text(f"🔄 {format_agent_name(node_name)} is working...")
+                # Create initial state
+                initial_state: PlannerState = {
+                    **base_state,
+                    "messages": [HumanMessage(content=base_state["user_request"])],
+                    "session_id": uuid4().hex,
+                }
                 
-                # Get the latest message
-                if node_state.get("messages"):
-                    last_message = node_state["messages"][-1]
-                    if isinstance(last_message, BaseMessage):
-                        content = last_message.content
-                        
-                        # Display in the appropriate container
-                        if node_name in agent_containers:
-                            with agent_containers[node_name]:
-                                # Show a preview of the agent's work
-                                preview = content[:300] + "..." if len(content) > 300 else content
-                                st.success(f"✅ {preview}")
-            
-            # Complete
-            progress_bar.progress(1.0)
-            status_text.text("✨ Trip planning complete!")
+                # Run workflow with real-time updates
+                final_state = run_plan_with_updates(initial_state)
+                if final_state.get("final_itinerary"):
+                    plan_cache.put(plan_key, {key: final_state.get(key) for key in PLAN_RESULT_KEYS})
             
             # Display final itinerary
-            final_state = node_state
             final_itinerary = final_state.get("final_itinerary", "")
             
             if final_itinerary:
@@ -241,8 +441,8 @@ def main():
                 # Offer download option
                 st.download_button(
                     label="📥 Download Itinerary",
-                    data=final_itinerary,
-                    file_name=f"travel_itinerary_{destination}_{departure_date}.txt",
+                    data=final_itinerary.encode("utf-8"),
+                    file_name=f"travel_itinerary_{destination}_{departure_date.isoformat()}.txt",
                     mime="text/plain"
                 )
                 
@@ -250,22 +450,18 @@ def main():
                 st.markdown("---")
                 st.subheader("📊 Agent Summaries")
                 
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    if final_state.get("flight_summary"):
-                        st.info("✈️ **Flight Options**")
-                        st.write(final_state["flight_summary"])
-                
-                with col2:
-                    if final_state.get("hotel_summary"):
-                        st.info("🏨 **Hotel Recommendation**")
-                        st.write(final_state["hotel_summary"])
-                
-                with col3:
-                    if final_state.get("activities_summary"):
-                        st.info("🎯 **Activities & Experiences**")
-                        st.write(final_state["activities_summary"])
+                summaries = [
+                    (title, final_state[key])
+                    for title, key in [
+                        ("✈️ **Flight Options**", "flight_summary"),
+                        ("🏨 **Hotel Recommendation**", "hotel_summary"),
+                        ("🎯 **Activities & Experiences**", "activities_summary"),
+                    ]
+                    if final_state.get(key)
+                ]
+                # One markdown element per column instead of separate heading and body writes
+                for col, (title, body) in zip(st.columns(3), summaries):
+                    col.markdown(f"> {title}\n\n{body}")
             
         except Exception as e:
             st.error(f"An error occurred while planning your trip: {str(e)}")
@@ -295,15 +491,8 @@ def main():
         st.markdown("---")
         st.subheader("✨ Popular Destinations")
         
-        cols = st.columns(3)
-        for i, (dest, info) in enumerate(list(DESTINATIONS.items())[:3]):
-            with cols[i]:
-                st.markdown(f"""
-                **{dest.title()}, {info['country']}**
-                - {info['highlights'][0]}
-                - {info['highlights'][1]}
-                - {info['highlights'][2]}
-                """)
+        for col, destination_md in zip(st.columns(3), popular_destinations_md()):
+            col.markdown(destination_md)
 
 
 if __name__ == "__main__":